@@ -1,6 +1,4 @@
 """Audio recording functionality."""
-import io
-import threading
 from typing import Callable
 
 import numpy as np
@@ -8,6 +6,28 @@ import sounddevice as sd
 
 from .config import get_config
 
+# Seconds of audio preallocated up front; the buffer doubles on demand for
+# longer recordings.
+PREALLOC_SECONDS = 60
+
+
+def _downmix_to_mono(audio_data: np.ndarray) -> np.ndarray:
+    """Downmix multi-channel audio to mono.
+
+    numpy's float32 mean accumulates in float32, which drifts on long
+    buffers, so sum in float64 and scale. Stereo gets a cheap two-column
+    fast path since that is the only multi-channel layout we see in
+    practice.
+    """
+    channels = audio_data.shape[1]
+    if channels == 1:
+        return audio_data[:, 0]
+    if channels == 2:
+        return (audio_data[:, 0] + audio_data[:, 1]) * np.float32(0.5)
+    mixed = np.add.reduce(audio_data, axis=1, dtype=np.float64)
+    mixed *= 1.0 / channels
+    return mixed.astype(np.float32)
+
 
 class AudioRecorder:
     """Records audio from the microphone."""
@@ -17,28 +37,60 @@ class AudioRecorder:
         self._sample_rate = self._config["sample_rate"]
         self._channels = self._config["channels"]
         self._recording = False
-        self._frames: list[np.ndarray] = []
         self._stream: sd.InputStream | None = None
-        self._lock = threading.Lock()
+
+        # Preallocated contiguous buffer written by the PortAudio callback.
+        # The callback is the only producer and stop() only reads after the
+        # stream is closed, so a plain int write index is safe under the GIL
+        # - no lock. Mono (the default) is stored 1D so stop() can hand back
+        # a view with no downmix pass and no astype copy. Recordings longer
+        # than the preallocation grow the buffer geometrically, so the
+        # amortized per-callback cost stays O(frames) and stop() never has
+        # to concatenate.
+        self._is_mono = self._channels == 1
+        self._capacity = PREALLOC_SECONDS * self._sample_rate
+        shape = (self._capacity,) if self._is_mono else (self._capacity, self._channels)
+        self._buf = np.empty(shape, dtype=np.float32)
+        self._write = 0
+
+    def _grow(self, needed: int) -> None:
+        """Double the buffer until it can hold `needed` frames."""
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        shape = (capacity,) if self._is_mono else (capacity, self._channels)
+        new_buf = np.empty(shape, dtype=np.float32)
+        new_buf[:self._write] = self._buf[:self._write]
+        self._buf = new_buf
+        self._capacity = capacity
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         """Callback for audio stream."""
         if status:
             print(f"Audio status: {status}")
         if self._recording:
-            with self._lock:
-                self._frames.append(indata.copy())
+            if self._is_mono:
+                indata = indata[:, 0]
+            end = self._write + frames
+            if end > self._capacity:
+                self._grow(end)
+            self._buf[self._write:end] = indata
+            self._write = end
 
     def start(self) -> None:
         """Start recording audio."""
-        with self._lock:
-            self._frames = []
-            self._recording = True
+        self._write = 0
+        self._recording = True
 
+        # A larger blocksize amortizes the C->Python callback cost: 1024
+        # samples at 16kHz means ~15 callbacks/s instead of ~100/s with
+        # PortAudio's default.
         self._stream = sd.InputStream(
             samplerate=self._sample_rate,
             channels=self._channels,
             dtype=np.float32,
+            blocksize=self._config.get("blocksize", 1024),
+            latency="low",
             callback=self._audio_callback,
         )
         self._stream.start()
@@ -52,17 +104,19 @@ class AudioRecorder:
             self._stream.close()
             self._stream = None
 
-        with self._lock:
-            if not self._frames:
-                return np.array([], dtype=np.float32)
-            audio_data = np.concatenate(self._frames, axis=0)
-            self._frames = []
+        if self._write == 0:
+            return np.array([], dtype=np.float32)
+        audio_data = self._buf[:self._write]
 
-        # Flatten to mono if needed
-        if len(audio_data.shape) > 1:
-            audio_data = audio_data.mean(axis=1)
+        # Flatten to mono if needed; the downmix writes into a fresh array.
+        if audio_data.ndim > 1:
+            return _downmix_to_mono(audio_data).astype(np.float32, copy=False)
 
-        return audio_data.astype(np.float32)
+        # Copy out of the reusable recording buffer: recordings are consumed
+        # asynchronously (queued for the processing worker), and start()
+        # rewinds the write index, so a view would be overwritten in place
+        # by the next recording while Whisper is still reading it.
+        return audio_data.copy()
 
     @property
     def is_recording(self) -> bool:
@@ -120,22 +174,35 @@ def get_recorder() -> AudioRecorder:
     return _recorder
 
 
-def record_audio_blocking(duration: float) -> np.ndarray:
-    """Record audio for a fixed duration (blocking)."""
+# Reused buffers for record_audio_blocking, keyed by (frames, channels).
+_rec_buffers: dict[tuple[int, int], np.ndarray] = {}
+
+
+def record_audio_blocking(duration: float, out: np.ndarray | None = None) -> np.ndarray:
+    """Record audio for a fixed duration (blocking).
+
+    Repeated recordings of the same duration reuse a cached buffer, so the
+    returned array is only valid until the next call; pass `out` to record
+    into your own buffer instead.
+    """
     config = get_config().audio
     sample_rate = config["sample_rate"]
     channels = config["channels"]
+    n_frames = int(duration * sample_rate)
+
+    if out is None:
+        key = (n_frames, channels)
+        out = _rec_buffers.get(key)
+        if out is None:
+            out = np.empty((n_frames, channels), dtype=np.float32)
+            _rec_buffers[key] = out
 
-    audio_data = sd.rec(
-        int(duration * sample_rate),
-        samplerate=sample_rate,
-        channels=channels,
-        dtype=np.float32,
-    )
+    audio_data = sd.rec(samplerate=sample_rate, out=out)
     sd.wait()
 
-    # Flatten to mono
-    if len(audio_data.shape) > 1:
-        audio_data = audio_data.mean(axis=1)
+    # Flatten to mono; copy=False returns the same array when it is
+    # already float32 (the usual case, since sd.rec records float32).
+    if audio_data.ndim > 1:
+        audio_data = _downmix_to_mono(audio_data)
 
-    return audio_data.astype(np.float32)
+    return audio_data.astype(np.float32, copy=False)
@@ -0,0 +1,47 @@
+"""Compile config.yaml into an importable defaults module.
+
+YAML parsing is pure startup cost for values that never change at runtime
+(sample rate, whisper model, hotkey codes). Running this script bakes a
+config.yaml into ``_defaults_compiled.py`` as a Python literal, which
+``config.py`` imports instead of the inline defaults. The generated module
+is optional - when it is absent, the inline ``DEFAULT_CONFIG`` is used and
+nothing changes.
+
+Usage:
+    python -m vibe_local.build_defaults [path/to/config.yaml]
+"""
+import pprint
+import sys
+from pathlib import Path
+
+from .config import DEFAULT_CONFIG, _load_yaml
+
+_HEADER = '"""Generated by vibe_local.build_defaults - do not edit."""\n'
+
+
+def build_defaults(config_path: str | Path | None = None) -> Path:
+    """Write _defaults_compiled.py from the defaults merged with a YAML file."""
+    config = {key: (value.copy() if isinstance(value, dict) else value)
+              for key, value in DEFAULT_CONFIG.items()}
+
+    if config_path is None:
+        config_path = Path(__file__).parent.parent / "config.yaml"
+    config_path = Path(config_path)
+
+    if config_path.exists():
+        for key, value in _load_yaml(config_path).items():
+            if key in config and isinstance(config[key], dict) and isinstance(value, dict):
+                config[key].update(value)
+            else:
+                config[key] = value
+
+    out_path = Path(__file__).parent / "_defaults_compiled.py"
+    with open(out_path, "w") as f:
+        f.write(_HEADER)
+        f.write(f"CONFIG = {pprint.pformat(config, sort_dicts=False)}\n")
+    return out_path
+
+
+if __name__ == "__main__":
+    path = build_defaults(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"Wrote {path}")
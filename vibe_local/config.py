@@ -1,41 +1,92 @@
 """Configuration management for Vibe Local."""
 import os
+import pickle
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer PyYAML's libyaml bindings - same output, several times faster than
+# the pure-Python loader/dumper.
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 DEFAULT_CONFIG = {
     "hotkeys": {
         "transcribe": ["KEY_LEFTMETA", "KEY_LEFTSHIFT", "KEY_V"],
         "rewrite": ["KEY_LEFTMETA", "KEY_LEFTSHIFT", "KEY_R"],
         "context_reply": ["KEY_LEFTMETA", "KEY_LEFTSHIFT", "KEY_C"],
+        "debounce_ms": 20,
     },
     "whisper": {
         "model": "medium",
         "language": "en",
         "device": "cuda",
-        "compute_type": "float16",
+        "compute_type": "auto",
+        "beam_size": 1,
+        "warmup": True,
     },
     "ollama": {
         "model": "llama3.2",
         "base_url": "http://localhost:11434",
     },
     "style": "casual",
+    "typing": {
+        "fast_paste": True,
+        "fast_paste_threshold": 120,
+    },
     "vocabulary": [],
     "programming_context": "",
     "audio": {
         "sample_rate": 16000,
         "channels": 1,
+        "blocksize": 1024,
     },
 }
 
+# A tree built with vibe_local.build_defaults ships the defaults pre-compiled
+# as a Python literal, skipping any YAML work on cold start.
+try:
+    from ._defaults_compiled import CONFIG as DEFAULT_CONFIG
+except ImportError:
+    pass
+
+# Pre-pickled snapshot of the defaults. pickle.loads is a fast deep copy for
+# small nested dicts, and every Config gets its own copy - a shallow .copy()
+# would share the nested dicts, so merging user config or editing settings
+# would mutate DEFAULT_CONFIG itself.
+_DEFAULTS_SNAPSHOT = pickle.dumps(DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# Parsed-YAML cache keyed on file mtime, so re-initializing Config (or
+# pointing several instances at the same file) does not re-parse unchanged
+# files.
+_yaml_cache: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+# First default-location config file found; the search locations never change
+# within a process, so resolve them once instead of stat()ing per Config.
+_resolved_config_path: Path | None = None
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    """Parse a YAML file, reusing the cached result while the file is unchanged."""
+    mtime = path.stat().st_mtime_ns
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path) as f:
+        data = yaml.load(f, Loader=_Loader) or {}
+    _yaml_cache[path] = (mtime, data)
+    return data
+
 
 class Config:
     """Configuration container."""
 
     def __init__(self, config_path: str | Path | None = None):
-        self._config = DEFAULT_CONFIG.copy()
+        self._config = pickle.loads(_DEFAULTS_SNAPSHOT)
         self._config_path = config_path
 
         if config_path:
@@ -46,6 +97,12 @@ class Config:
 
     def _try_load_default(self) -> None:
         """Try to load config from default locations."""
+        global _resolved_config_path
+
+        if _resolved_config_path is not None:
+            self.load(_resolved_config_path)
+            return
+
         locations = [
             Path.cwd() / "config.yaml",
             Path.home() / ".config" / "vibe-local" / "config.yaml",
@@ -53,18 +110,22 @@ class Config:
         ]
 
         for path in locations:
-            if path.exists():
-                self.load(path)
+            if self.load(path):
+                _resolved_config_path = path
                 return
 
-    def load(self, path: str | Path) -> None:
-        """Load configuration from a YAML file."""
+    def load(self, path: str | Path) -> bool:
+        """Load configuration from a YAML file. Returns True if it existed."""
         path = Path(path)
-        if path.exists():
-            with open(path) as f:
-                user_config = yaml.safe_load(f) or {}
-            self._merge_config(user_config)
-            self._config_path = path
+        # _load_yaml stats the file anyway, so a separate exists() check
+        # would just be a second syscall.
+        try:
+            user_config = _load_yaml(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        self._merge_config(user_config)
+        self._config_path = path
+        return True
 
     def _merge_config(self, user_config: dict[str, Any]) -> None:
         """Deep merge user config into default config."""
@@ -80,7 +141,7 @@ class Config:
         if path:
             path.parent.mkdir(parents=True, exist_ok=True)
             with open(path, "w") as f:
-                yaml.dump(self._config, f, default_flow_style=False)
+                yaml.dump(self._config, f, Dumper=_Dumper, default_flow_style=False)
 
     @property
     def hotkeys(self) -> dict[str, list[str]]:
@@ -102,6 +163,10 @@ class Config:
     def audio(self) -> dict[str, Any]:
         return self._config["audio"]
 
+    @property
+    def typing(self) -> dict[str, Any]:
+        return self._config.get("typing", {})
+
     @property
     def vocabulary(self) -> list[str]:
         return self._config.get("vocabulary", [])
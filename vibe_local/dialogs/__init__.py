@@ -0,0 +1 @@
+"""Dialog windows, imported lazily so the tray starts without them."""
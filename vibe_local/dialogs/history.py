@@ -0,0 +1,179 @@
+"""Transcription history dialog."""
+import subprocess
+
+from PyQt6.QtWidgets import (
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit,
+    QPushButton, QWidget, QListWidget, QListWidgetItem, QSplitter
+)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+from ..history import get_history
+
+
+class HistoryDialog(QDialog):
+    """Dialog showing transcription history."""
+
+    # The worker thread records entries, so the change callback fires off
+    # the GUI thread; re-emitting through a signal queues the reload onto it
+    _history_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Transcription History")
+        self.setMinimumWidth(600)
+        self.setMinimumHeight(400)
+
+        self._history = get_history()
+        self._pending_reload = False
+        self._history_changed.connect(self._schedule_reload)
+        # One stable reference, so add/remove always see the same callback
+        self._history_callback = self._history_changed.emit
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Splitter for list and detail
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # Left side: list of entries
+        self._list = QListWidget()
+        self._list.currentRowChanged.connect(self._on_selection_changed)
+        splitter.addWidget(self._list)
+
+        # Right side: detail view
+        detail_widget = QWidget()
+        detail_layout = QVBoxLayout(detail_widget)
+
+        detail_layout.addWidget(QLabel("Final text:"))
+        self._final_text = QTextEdit()
+        self._final_text.setReadOnly(True)
+        detail_layout.addWidget(self._final_text)
+
+        detail_layout.addWidget(QLabel("Raw transcription:"))
+        self._raw_text = QTextEdit()
+        self._raw_text.setReadOnly(True)
+        self._raw_text.setMaximumHeight(80)
+        detail_layout.addWidget(self._raw_text)
+
+        splitter.addWidget(detail_widget)
+        splitter.setSizes([200, 400])
+
+        layout.addWidget(splitter)
+
+        # Buttons
+        btn_layout = QHBoxLayout()
+
+        copy_btn = QPushButton("Copy to Clipboard")
+        copy_btn.clicked.connect(self._copy_to_clipboard)
+        btn_layout.addWidget(copy_btn)
+
+        btn_layout.addStretch()
+
+        clear_btn = QPushButton("Clear History")
+        clear_btn.clicked.connect(self._clear_history)
+        btn_layout.addWidget(clear_btn)
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+
+        layout.addLayout(btn_layout)
+
+    def _load_history(self):
+        """Load history entries into the list."""
+        entries = self._history.get_entries()
+
+        # One layout/paint pass for the whole rebuild instead of one per
+        # addItem, and no selection-changed signals while the list is in flux
+        self._list.setUpdatesEnabled(False)
+        self._list.blockSignals(True)
+        try:
+            self._list.clear()
+
+            for entry in entries:
+                # Label was rendered once when the entry was recorded
+                item = QListWidgetItem(entry.list_label)
+                item.setData(Qt.ItemDataRole.UserRole, entry)
+                self._list.addItem(item)
+        finally:
+            self._list.blockSignals(False)
+            self._list.setUpdatesEnabled(True)
+
+        # Select first item if available; with signals blocked above, the
+        # cleared state never reached the detail panes
+        if self._list.count() > 0:
+            self._list.setCurrentRow(0)
+        else:
+            self._on_selection_changed(-1)
+
+    def _on_selection_changed(self, row: int):
+        """Handle selection change in the list."""
+        if row < 0:
+            self._final_text.clear()
+            self._raw_text.clear()
+            return
+
+        item = self._list.item(row)
+        entry = item.data(Qt.ItemDataRole.UserRole)
+
+        self._final_text.setPlainText(entry.final_text)
+        self._raw_text.setPlainText(entry.raw_text)
+
+    def _copy_to_clipboard(self):
+        """Copy the final text to clipboard."""
+        text = self._final_text.toPlainText()
+        if not text:
+            return
+
+        # Qt's in-process clipboard first - forking wl-copy costs ~10ms of
+        # exec plus a separate Wayland handshake per click
+        app = QApplication.instance()
+        if app:
+            try:
+                app.clipboard().setText(text)
+                return
+            except Exception:
+                pass
+
+        # Fallback to wl-copy
+        try:
+            subprocess.run(
+                ["wl-copy", text],
+                check=True,
+                timeout=2,
+            )
+        except Exception:
+            pass
+
+    def _clear_history(self):
+        """Clear all history."""
+        self._history.clear()
+
+    def _schedule_reload(self):
+        """Coalesce bursts of history changes into one rebuild."""
+        if self._pending_reload:
+            return
+        self._pending_reload = True
+        QTimer.singleShot(50, self._do_reload)
+
+    def _do_reload(self):
+        self._pending_reload = False
+        self._load_history()
+
+    def showEvent(self, event):
+        """Refresh and track history changes while visible."""
+        # remove-then-add keeps registration idempotent across re-shows
+        self._history.remove_change_callback(self._history_callback)
+        self._history.add_change_callback(self._history_callback)
+        self._load_history()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Stop tracking changes while hidden.
+
+        hideEvent rather than closeEvent: the Close button hides via
+        accept() without a close event, which used to leak the callback.
+        """
+        self._history.remove_change_callback(self._history_callback)
+        super().hideEvent(event)
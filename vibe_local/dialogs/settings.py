@@ -0,0 +1,166 @@
+"""Settings dialog for Vibe Local."""
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
+    QPushButton, QTabWidget, QWidget, QComboBox, QFormLayout
+)
+
+from ..config import get_config
+from ..llm import reset_llm_cache
+from ..transcribe import unload_model
+
+
+class SettingsDialog(QDialog):
+    """Settings dialog for Vibe Local."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Vibe Local Settings")
+        self.setMinimumWidth(500)
+        self.setMinimumHeight(400)
+
+        self._config = get_config()
+        self._setup_ui()
+        self._load_settings()
+
+    def showEvent(self, event):
+        """Re-read settings on each show so a reused dialog never keeps
+        unsaved edits from a previous Cancel."""
+        self._load_settings()
+        super().showEvent(event)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Tab widget
+        tabs = QTabWidget()
+
+        # Vocabulary tab
+        vocab_tab = QWidget()
+        vocab_layout = QVBoxLayout(vocab_tab)
+        vocab_layout.addWidget(QLabel("Custom vocabulary (one term per line):"))
+        vocab_layout.addWidget(QLabel("These terms will be preserved exactly as written."))
+        self._vocab_edit = QTextEdit()
+        self._vocab_edit.setPlaceholderText("GameDevBuddy\nC++\nUnreal Engine\nuseState")
+        vocab_layout.addWidget(self._vocab_edit)
+        tabs.addTab(vocab_tab, "Vocabulary")
+
+        # Context tab
+        context_tab = QWidget()
+        context_layout = QFormLayout(context_tab)
+        self._context_edit = QLineEdit()
+        self._context_edit.setPlaceholderText("C++, Rust, React, Unreal Engine")
+        context_layout.addRow("Programming context:", self._context_edit)
+        context_layout.addRow("", QLabel("Helps the AI understand your domain"))
+
+        self._style_combo = QComboBox()
+        self._style_combo.addItems(["casual", "formal", "very_casual"])
+        context_layout.addRow("Writing style:", self._style_combo)
+
+        tabs.addTab(context_tab, "Context")
+
+        # Whisper tab
+        whisper_tab = QWidget()
+        whisper_layout = QFormLayout(whisper_tab)
+        self._model_combo = QComboBox()
+        self._model_combo.addItems(["tiny", "base", "small", "medium", "large-v3"])
+        whisper_layout.addRow("Whisper model:", self._model_combo)
+        whisper_layout.addRow("", QLabel("Larger = more accurate but slower"))
+
+        self._language_edit = QLineEdit()
+        self._language_edit.setPlaceholderText("en")
+        whisper_layout.addRow("Language:", self._language_edit)
+
+        self._beam_combo = QComboBox()
+        self._beam_combo.addItems(["1", "5"])
+        whisper_layout.addRow("Beam size:", self._beam_combo)
+        whisper_layout.addRow("", QLabel("1 = fastest, 5 = slightly more accurate"))
+
+        self._compute_combo = QComboBox()
+        self._compute_combo.addItems(["auto", "int8", "int8_float16", "float16", "float32"])
+        whisper_layout.addRow("Compute type:", self._compute_combo)
+        whisper_layout.addRow("", QLabel("auto picks the fastest for your device"))
+
+        tabs.addTab(whisper_tab, "Whisper")
+
+        layout.addWidget(tabs)
+
+        # Buttons
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+
+        save_btn = QPushButton("Save")
+        save_btn.clicked.connect(self._save_settings)
+        btn_layout.addWidget(save_btn)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(cancel_btn)
+
+        layout.addLayout(btn_layout)
+
+    def _load_settings(self):
+        """Load current settings into the UI."""
+        # Vocabulary
+        vocab = self._config.vocabulary
+        self._vocab_edit.setPlainText("\n".join(vocab))
+
+        # Context
+        self._context_edit.setText(self._config.programming_context)
+
+        # Style
+        style = self._config.style
+        index = self._style_combo.findText(style)
+        if index >= 0:
+            self._style_combo.setCurrentIndex(index)
+
+        # Whisper
+        model = self._config.whisper.get("model", "medium")
+        index = self._model_combo.findText(model)
+        if index >= 0:
+            self._model_combo.setCurrentIndex(index)
+
+        self._language_edit.setText(self._config.whisper.get("language", "en"))
+
+        beam_size = str(self._config.whisper.get("beam_size", 1))
+        index = self._beam_combo.findText(beam_size)
+        if index >= 0:
+            self._beam_combo.setCurrentIndex(index)
+
+        compute_type = self._config.whisper.get("compute_type", "auto")
+        index = self._compute_combo.findText(compute_type)
+        if index >= 0:
+            self._compute_combo.setCurrentIndex(index)
+
+    def _save_settings(self):
+        """Save settings to config file."""
+        # Vocabulary
+        vocab_text = self._vocab_edit.toPlainText()
+        vocab_list = [v.strip() for v in vocab_text.split("\n") if v.strip()]
+        self._config._config["vocabulary"] = vocab_list
+
+        # Context
+        self._config._config["programming_context"] = self._context_edit.text()
+
+        # Style
+        self._config._config["style"] = self._style_combo.currentText()
+
+        # Whisper
+        old_model = self._config.whisper.get("model")
+        new_model = self._model_combo.currentText()
+        self._config._config["whisper"]["model"] = new_model
+        self._config._config["whisper"]["language"] = self._language_edit.text()
+        self._config._config["whisper"]["beam_size"] = int(self._beam_combo.currentText())
+        self._config._config["whisper"]["compute_type"] = self._compute_combo.currentText()
+
+        # Save to file
+        self._config.save()
+
+        # Cached LLM client/style must pick up the new settings
+        reset_llm_cache()
+
+        # Drop only the replaced Whisper model; keeping the cache warm when
+        # the model is unchanged skips a multi-second reload on the next use
+        if new_model != old_model:
+            unload_model(old_model)
+
+        self.accept()
@@ -1,16 +1,38 @@
 """Transcription history manager."""
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable
 
 
-@dataclass
+# Prefixes marking the action type in the history dialog's list labels
+_ACTION_PREFIXES = {
+    "transcribe": "",
+    "rewrite": "[R] ",
+    "context_reply": "[C] ",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class HistoryEntry:
     """A single history entry."""
     timestamp: datetime
     raw_text: str
     final_text: str
     action: str  # transcribe, rewrite, context_reply
+    # Display label, rendered once at insert - the history dialog rebuilds
+    # its list on every change, and re-slicing/strftime-ing all entries per
+    # refresh was O(entries) of string work for an unchanged result
+    list_label: str = ""
+
+
+def _make_label(timestamp: datetime, final_text: str, action: str) -> str:
+    """Build the one-line list label for an entry."""
+    preview = final_text[:40].replace("\n", " ")
+    if len(final_text) > 40:
+        preview += "..."
+    prefix = _ACTION_PREFIXES.get(action, "")
+    return f"{timestamp.strftime('%H:%M:%S')} - {prefix}{preview}"
 
 
 class TranscriptionHistory:
@@ -19,8 +41,8 @@ class TranscriptionHistory:
     _instance: "TranscriptionHistory | None" = None
 
     def __init__(self, max_entries: int = 50):
-        self._entries: list[HistoryEntry] = []
-        self._max_entries = max_entries
+        # deque(maxlen=...) drops the oldest entry automatically in O(1).
+        self._entries: deque[HistoryEntry] = deque(maxlen=max_entries)
         self._callbacks: list[Callable[[], None]] = []
 
     @classmethod
@@ -32,37 +54,37 @@ class TranscriptionHistory:
 
     def add(self, raw_text: str, final_text: str, action: str = "transcribe") -> None:
         """Add a new entry to history."""
+        timestamp = datetime.now()
         entry = HistoryEntry(
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             raw_text=raw_text,
             final_text=final_text,
             action=action,
+            list_label=_make_label(timestamp, final_text, action),
         )
-        self._entries.insert(0, entry)
-
-        # Trim to max entries
-        if len(self._entries) > self._max_entries:
-            self._entries = self._entries[:self._max_entries]
-
-        # Notify listeners
-        for callback in self._callbacks:
-            try:
-                callback()
-            except Exception:
-                pass
+        self._entries.appendleft(entry)
+        self._notify()
 
     def get_entries(self) -> list[HistoryEntry]:
         """Get all history entries (newest first)."""
-        return self._entries.copy()
+        return list(self._entries)
 
     def clear(self) -> None:
         """Clear all history."""
         self._entries.clear()
-        for callback in self._callbacks:
+        self._notify()
+
+    def _notify(self) -> None:
+        """Notify listeners of a change.
+
+        Iterates a snapshot so a callback may add/remove callbacks (e.g.
+        remove itself) without breaking the iteration.
+        """
+        for callback in tuple(self._callbacks):
             try:
                 callback()
-            except Exception:
-                pass
+            except Exception as e:
+                print(f"Error in history callback: {e}")
 
     def add_change_callback(self, callback: Callable[[], None]) -> None:
         """Add a callback to be notified when history changes."""
@@ -1,6 +1,10 @@
 """Cross-platform hotkey detection - evdev on Linux, pynput on Windows/macOS."""
-import asyncio
+import functools
 import platform
+import select
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Callable
@@ -22,6 +26,13 @@ class HotkeyEvent:
     pressed: bool  # True = pressed, False = released
 
 
+# Config section name -> action, shared by both listener implementations
+_ACTION_MAP = {
+    "transcribe": HotkeyAction.TRANSCRIBE,
+    "rewrite": HotkeyAction.REWRITE,
+    "context_reply": HotkeyAction.CONTEXT_REPLY,
+}
+
 # Detect platform
 _SYSTEM = platform.system()
 
@@ -31,6 +42,30 @@ if _SYSTEM == "Linux":
     import evdev
     from evdev import ecodes
 
+    # Plain int at module scope - avoids an ecodes attribute lookup per event
+    # in the read loop.
+    _EV_KEY = int(ecodes.EV_KEY)
+
+    @functools.lru_cache(maxsize=16)
+    def _parse_hotkey_codes(
+        config_items: tuple[tuple[str, tuple[str, ...]], ...],
+    ) -> dict[HotkeyAction, frozenset[int]]:
+        """Convert config key names to evdev key codes (cached per config)."""
+        result = {}
+        config = dict(config_items)
+        for name, action in _ACTION_MAP.items():
+            if name in config:
+                keys = set()
+                for key_name in config[name]:
+                    if hasattr(ecodes, key_name):
+                        keys.add(getattr(ecodes, key_name))
+                    else:
+                        print(f"Warning: Unknown key {key_name}")
+                if keys:
+                    result[action] = frozenset(keys)
+
+        return result
+
     class HotkeyListener:
         """
         Linux hotkey listener using evdev.
@@ -40,54 +75,81 @@ if _SYSTEM == "Linux":
 
         def __init__(self):
             self._config = get_config().hotkeys
-            self._pressed_keys: set[int] = set()
+            self._pressed_mask = 0
             self._callbacks: list[Callable[[HotkeyEvent], None]] = []
             self._running = False
             self._active_hotkey: HotkeyAction | None = None
             self._devices: list[evdev.InputDevice] = []
-
-            # Parse hotkey configs (keep as evdev key names)
+            self._reader: threading.Thread | None = None
+
+            # Suppress re-activations faster than this - X11 auto-repeat can
+            # deliver synthetic release/press pairs for a held hotkey, and
+            # press-only debouncing collapses the bounce to one clean cycle.
+            # Releases are never debounced: swallowing the release of an
+            # active hotkey would leave the recorder running.
+            self._debounce_s = self._config.get("debounce_ms", 20) / 1000.0
+            self._last_press: dict[HotkeyAction, float] = {}
+
+            # Parse hotkey configs (keep as evdev key names), then fold each
+            # key set into an int bitmask - key codes are small ints, so
+            # "all keys held" is a single (mask & pressed) == mask test.
             self._hotkeys = self._parse_hotkeys()
 
-        def _parse_hotkeys(self) -> dict[HotkeyAction, set[int]]:
-            """Convert config key names to evdev key codes."""
-            result = {}
-
-            action_map = {
-                "transcribe": HotkeyAction.TRANSCRIBE,
-                "rewrite": HotkeyAction.REWRITE,
-                "context_reply": HotkeyAction.CONTEXT_REPLY,
-            }
+            # Inverted index: key code -> (action, bitmask) of hotkeys that
+            # include it. Ordinary typing (keys in no hotkey) then checks
+            # nothing at all on the hot path.
+            self._key_to_masks: dict[int, list[tuple[HotkeyAction, int]]] = {}
+            for action, keys in self._hotkeys.items():
+                mask = sum(1 << code for code in keys)
+                for code in keys:
+                    self._key_to_masks.setdefault(code, []).append((action, mask))
 
-            for name, action in action_map.items():
-                if name in self._config:
-                    keys = set()
-                    for key_name in self._config[name]:
-                        if hasattr(ecodes, key_name):
-                            keys.add(getattr(ecodes, key_name))
-                        else:
-                            print(f"Warning: Unknown key {key_name}")
-                    if keys:
-                        result[action] = keys
+        def _parse_hotkeys(self) -> dict[HotkeyAction, frozenset[int]]:
+            """Convert config key names to evdev key codes."""
+            frozen = tuple(
+                (name, tuple(keys))
+                for name, keys in sorted(self._config.items())
+                if isinstance(keys, (list, tuple))
+            )
+            return _parse_hotkey_codes(frozen)
 
-            return result
+        @staticmethod
+        def _probe_device(path: str) -> "evdev.InputDevice | None":
+            """Open a device and keep it if it looks like a keyboard."""
+            try:
+                device = evdev.InputDevice(path)
+            except (PermissionError, OSError):
+                return None
+            try:
+                caps = device.capabilities()
+                # Check if device has key events and looks like a keyboard
+                if ecodes.EV_KEY in caps:
+                    key_caps = caps[ecodes.EV_KEY]
+                    # Has letter keys = keyboard
+                    if ecodes.KEY_A in key_caps and ecodes.KEY_Z in key_caps:
+                        return device
+            except OSError:
+                # Device vanished between list_devices() and the probe
+                pass
+            try:
+                device.close()
+            except OSError:
+                pass
+            return None
 
         def _find_keyboard_devices(self) -> list[evdev.InputDevice]:
-            """Find all keyboard input devices."""
-            devices = []
-            for path in evdev.list_devices():
-                try:
-                    device = evdev.InputDevice(path)
-                    caps = device.capabilities()
-                    # Check if device has key events and looks like a keyboard
-                    if ecodes.EV_KEY in caps:
-                        key_caps = caps[ecodes.EV_KEY]
-                        # Has letter keys = keyboard
-                        if ecodes.KEY_A in key_caps and ecodes.KEY_Z in key_caps:
-                            devices.append(device)
-                except (PermissionError, OSError):
-                    continue
-            return devices
+            """Find all keyboard input devices.
+
+            Probed in parallel - open/ioctl release the GIL and a typical
+            box has a dozen or more /dev/input nodes, so serial probing
+            dominates listener startup.
+            """
+            paths = evdev.list_devices()
+            if not paths:
+                return []
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                results = executor.map(self._probe_device, paths)
+            return [device for device in results if device is not None]
 
         def add_callback(self, callback: Callable[[HotkeyEvent], None]) -> None:
             self._callbacks.append(callback)
@@ -103,34 +165,75 @@ if _SYSTEM == "Linux":
                 except Exception as e:
                     print(f"Error in hotkey callback: {e}")
 
-        def _check_hotkeys(self, is_press: bool) -> None:
-            for action, keys in self._hotkeys.items():
-                if keys.issubset(self._pressed_keys):
-                    if is_press and self._active_hotkey is None:
+        def _debounced(self, action: HotkeyAction) -> bool:
+            """Return True if this activation arrived too soon after the last."""
+            now = time.monotonic()
+            if now - self._last_press.get(action, 0.0) < self._debounce_s:
+                return True
+            self._last_press[action] = now
+            return False
+
+        def _check_hotkeys(self, is_press: bool, code: int) -> None:
+            active = self._active_hotkey
+            if is_press:
+                # While a hotkey is held no new one can activate, so every
+                # further keystroke bails out immediately.
+                if active is not None:
+                    return
+                pressed = self._pressed_mask
+                for action, mask in self._key_to_masks.get(code, ()):
+                    if (mask & pressed) == mask and not self._debounced(action):
                         self._active_hotkey = action
                         self._emit(HotkeyEvent(action=action, pressed=True))
-                elif action == self._active_hotkey and not is_press:
-                    self._active_hotkey = None
-                    self._emit(HotkeyEvent(action=action, pressed=False))
-
-        async def _read_device(self, device: evdev.InputDevice) -> None:
-            """Read events from a single device."""
-            try:
-                async for event in device.async_read_loop():
-                    if not self._running:
-                        break
-                    if event.type == ecodes.EV_KEY:
-                        if event.value == 1:  # Key press
-                            self._pressed_keys.add(event.code)
-                            self._check_hotkeys(is_press=True)
-                        elif event.value == 0:  # Key release
-                            self._pressed_keys.discard(event.code)
-                            self._check_hotkeys(is_press=False)
-            except (OSError, IOError):
-                pass  # Device disconnected
-
-        async def start(self) -> None:
-            """Start listening for hotkeys."""
+                        return
+            else:
+                # Only the active hotkey can be released - and its release
+                # is never debounced, so the recorder always stops
+                if active is None:
+                    return
+                pressed = self._pressed_mask
+                for action, mask in self._key_to_masks.get(code, ()):
+                    if action is active and (mask & pressed) != mask:
+                        self._active_hotkey = None
+                        self._emit(HotkeyEvent(action=action, pressed=False))
+                        return
+
+        def _read_devices(self) -> None:
+            """Blocking select() loop over all device fds.
+
+            Runs in a dedicated daemon thread; callbacks fire on this
+            thread for matched hotkeys only.
+            """
+            # Bind hot-loop names as locals; this loop runs for every key
+            # event on every device, hotkey or not.
+            ev_key = _EV_KEY
+            check = self._check_hotkeys
+            fds = {device.fd: device for device in self._devices}
+
+            while self._running and fds:
+                try:
+                    readable, _, _ = select.select(fds, [], [], 0.5)
+                except OSError:
+                    break  # A device fd was closed under us
+                for fd in readable:
+                    try:
+                        events = fds[fd].read()
+                    except OSError:
+                        del fds[fd]  # Device disconnected
+                        continue
+                    for event in events:
+                        if event.type == ev_key:
+                            value = event.value
+                            code = event.code
+                            if value == 1:  # Key press
+                                self._pressed_mask |= 1 << code
+                                check(is_press=True, code=code)
+                            elif value == 0:  # Key release
+                                self._pressed_mask &= ~(1 << code)
+                                check(is_press=False, code=code)
+
+        def start(self) -> None:
+            """Start listening for hotkeys (returns immediately)."""
             print("Starting hotkey listener (evdev)...")
 
             self._devices = self._find_keyboard_devices()
@@ -141,9 +244,8 @@ if _SYSTEM == "Linux":
             print(f"Found {len(self._devices)} keyboard device(s)")
             self._running = True
 
-            # Read from all devices concurrently
-            tasks = [self._read_device(dev) for dev in self._devices]
-            await asyncio.gather(*tasks)
+            self._reader = threading.Thread(target=self._read_devices, daemon=True)
+            self._reader.start()
 
         def stop(self) -> None:
             self._running = False
@@ -190,6 +292,39 @@ else:
         "KEY_RIGHTMETA": keyboard.Key.cmd_r,
     }
 
+    @functools.lru_cache(maxsize=64)
+    def _resolve_key(key_name: str):
+        """Resolve a config key name to a pynput key (cached)."""
+        if key_name in KEY_MAP:
+            return KEY_MAP[key_name]
+        if key_name.startswith("KEY_"):
+            char = key_name[4:].lower()
+            if len(char) == 1:
+                return keyboard.KeyCode.from_char(char)
+        return None
+
+    # Collapse left/right modifier variants to one canonical key with a
+    # single dict lookup instead of an isinstance + tuple-membership chain.
+    _KEY_NORMALIZE = {
+        keyboard.Key.ctrl_l: keyboard.Key.ctrl_l,
+        keyboard.Key.ctrl_r: keyboard.Key.ctrl_l,
+        keyboard.Key.shift_l: keyboard.Key.shift_l,
+        keyboard.Key.shift_r: keyboard.Key.shift_l,
+        keyboard.Key.alt_l: keyboard.Key.alt_l,
+        keyboard.Key.alt_r: keyboard.Key.alt_l,
+        keyboard.Key.cmd: keyboard.Key.cmd,
+        keyboard.Key.cmd_r: keyboard.Key.cmd,
+    }
+
+    # Bit per (normalized) modifier. Every configured hotkey requires at
+    # least one modifier, so a zero mask means plain typing.
+    _MOD_BITS = {
+        keyboard.Key.ctrl_l: 1,
+        keyboard.Key.shift_l: 2,
+        keyboard.Key.alt_l: 4,
+        keyboard.Key.cmd: 8,
+    }
+
     class HotkeyListener:
         """
         Windows/macOS hotkey listener using pynput.
@@ -197,48 +332,57 @@ else:
 
         def __init__(self):
             self._config = get_config().hotkeys
-            self._pressed_keys: set = set()
             self._callbacks: list[Callable[[HotkeyEvent], None]] = []
             self._listener: keyboard.Listener | None = None
             self._active_hotkey: HotkeyAction | None = None
+
+            # Suppress re-activations faster than this to debounce spurious
+            # auto-repeat release/press pairs. Presses only - swallowing a
+            # release would leave the recorder running.
+            self._debounce_s = self._config.get("debounce_ms", 20) / 1000.0
+            self._last_press: dict[HotkeyAction, float] = {}
             self._hotkeys = self._parse_hotkeys()
 
-        def _parse_hotkeys(self) -> dict[HotkeyAction, set]:
+            # Assign each key that appears in any hotkey a bit index so the
+            # pressed state is a single int and "all keys held" is one
+            # integer AND instead of a set subset walk. Keys outside every
+            # hotkey are never tracked. The inverted index maps key ->
+            # (action, key bitmask, required-modifier mask), so unrelated
+            # keystrokes check nothing.
+            self._mod_mask = 0
+            self._pressed_mask = 0
+            self._bit_of: dict = {}
+            self._key_to_actions: dict = {}
+            for action, keys in self._hotkeys.items():
+                mask = 0
+                required_mods = 0
+                for key in keys:
+                    if key not in self._bit_of:
+                        self._bit_of[key] = len(self._bit_of)
+                    mask |= 1 << self._bit_of[key]
+                    required_mods |= _MOD_BITS.get(key, 0)
+                for key in keys:
+                    self._key_to_actions.setdefault(key, []).append(
+                        (action, mask, required_mods)
+                    )
+
+        def _parse_hotkeys(self) -> dict[HotkeyAction, frozenset]:
             result = {}
-            action_map = {
-                "transcribe": HotkeyAction.TRANSCRIBE,
-                "rewrite": HotkeyAction.REWRITE,
-                "context_reply": HotkeyAction.CONTEXT_REPLY,
-            }
-
-            for name, action in action_map.items():
+            for name, action in _ACTION_MAP.items():
                 if name in self._config:
                     keys = set()
                     for key_name in self._config[name]:
-                        if key_name in KEY_MAP:
-                            keys.add(KEY_MAP[key_name])
-                        elif key_name.startswith("KEY_"):
-                            char = key_name[4:].lower()
-                            if len(char) == 1:
-                                keys.add(keyboard.KeyCode.from_char(char))
+                        key = _resolve_key(key_name)
+                        if key is not None:
+                            keys.add(key)
                     if keys:
-                        result[action] = keys
+                        result[action] = frozenset(keys)
 
             return result
 
         def _normalize_key(self, key):
-            if isinstance(key, keyboard.Key):
-                if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                    return keyboard.Key.ctrl_l
-                elif key in (keyboard.Key.shift_l, keyboard.Key.shift_r):
-                    return keyboard.Key.shift_l
-                elif key in (keyboard.Key.alt_l, keyboard.Key.alt_r):
-                    return keyboard.Key.alt_l
-                elif key in (keyboard.Key.cmd, keyboard.Key.cmd_r):
-                    return keyboard.Key.cmd
-                return key
-            elif isinstance(key, keyboard.KeyCode):
-                return key
+            if isinstance(key, (keyboard.Key, keyboard.KeyCode)):
+                return _KEY_NORMALIZE.get(key, key)
             return None
 
         def add_callback(self, callback: Callable[[HotkeyEvent], None]) -> None:
@@ -255,29 +399,75 @@ else:
                 except Exception as e:
                     print(f"Error in hotkey callback: {e}")
 
-        def _check_hotkeys(self, is_press: bool) -> None:
-            for action, keys in self._hotkeys.items():
-                if keys.issubset(self._pressed_keys):
-                    if is_press and self._active_hotkey is None:
+        def _debounced(self, action: HotkeyAction) -> bool:
+            """Return True if this activation arrived too soon after the last."""
+            now = time.monotonic()
+            if now - self._last_press.get(action, 0.0) < self._debounce_s:
+                return True
+            self._last_press[action] = now
+            return False
+
+        def _check_hotkeys(self, is_press: bool, key) -> None:
+            active = self._active_hotkey
+            if is_press:
+                # While a hotkey is held no new one can activate, so every
+                # further keystroke bails out immediately.
+                if active is not None:
+                    return
+                pressed = self._pressed_mask
+                mods = self._mod_mask
+                for action, mask, required_mods in self._key_to_actions.get(key, ()):
+                    if (
+                        (required_mods & mods) == required_mods
+                        and (mask & pressed) == mask
+                        and not self._debounced(action)
+                    ):
                         self._active_hotkey = action
                         self._emit(HotkeyEvent(action=action, pressed=True))
-                elif action == self._active_hotkey and not is_press:
-                    self._active_hotkey = None
-                    self._emit(HotkeyEvent(action=action, pressed=False))
+                        return
+            else:
+                # Only the active hotkey can be released - and its release
+                # is never debounced, so the recorder always stops
+                if active is None:
+                    return
+                pressed = self._pressed_mask
+                for action, mask, required_mods in self._key_to_actions.get(key, ()):
+                    if action is active and (mask & pressed) != mask:
+                        self._active_hotkey = None
+                        self._emit(HotkeyEvent(action=action, pressed=False))
+                        return
 
         def _on_press(self, key) -> None:
             normalized = self._normalize_key(key)
-            if normalized:
-                self._pressed_keys.add(normalized)
-                self._check_hotkeys(is_press=True)
+            if not normalized:
+                return
+            mod_bit = _MOD_BITS.get(normalized, 0)
+            if mod_bit:
+                self._mod_mask |= mod_bit
+            elif self._mod_mask == 0:
+                # Plain typing with no modifier held - no hotkey can match
+                return
+            key_bit = self._bit_of.get(normalized)
+            if key_bit is None:
+                return  # Key is in no hotkey - nothing to track
+            self._pressed_mask |= 1 << key_bit
+            self._check_hotkeys(is_press=True, key=normalized)
 
         def _on_release(self, key) -> None:
             normalized = self._normalize_key(key)
-            if normalized:
-                self._pressed_keys.discard(normalized)
-                self._check_hotkeys(is_press=False)
+            if not normalized:
+                return
+            mod_bit = _MOD_BITS.get(normalized, 0)
+            if mod_bit:
+                self._mod_mask &= ~mod_bit
+            key_bit = self._bit_of.get(normalized)
+            if key_bit is None:
+                return
+            self._pressed_mask &= ~(1 << key_bit)
+            self._check_hotkeys(is_press=False, key=normalized)
 
-        async def start(self) -> None:
+        def start(self) -> None:
+            """Start listening for hotkeys (returns immediately)."""
             print("Starting hotkey listener (pynput)...")
             self._listener = keyboard.Listener(
                 on_press=self._on_press,
@@ -286,9 +476,6 @@ else:
             self._listener.start()
             print("Hotkey listener started")
 
-            while self._listener and self._listener.is_alive():
-                await asyncio.sleep(0.1)
-
         def stop(self) -> None:
             if self._listener:
                 self._listener.stop()
@@ -306,25 +493,35 @@ else:
             return False
 
 
+# Readable names for modifier keys in help text
+_KEY_DISPLAY_NAMES = {
+    "KEY_LEFTMETA": "Super",
+    "KEY_RIGHTMETA": "Super",
+    "KEY_LEFTSHIFT": "Shift",
+    "KEY_RIGHTSHIFT": "Shift",
+    "KEY_LEFTCTRL": "Ctrl",
+    "KEY_RIGHTCTRL": "Ctrl",
+    "KEY_LEFTALT": "Alt",
+    "KEY_RIGHTALT": "Alt",
+}
+
+# (hotkeys-dict identity, rendered help) - the text only depends on config
+_hotkey_help_cache: tuple[int, str] | None = None
+
+
 def get_hotkey_help() -> str:
     """Get help text for configured hotkeys."""
+    global _hotkey_help_cache
+
     config = get_config().hotkeys
+    if _hotkey_help_cache is not None and _hotkey_help_cache[0] == id(config):
+        return _hotkey_help_cache[1]
 
     def format_keys(keys: list[str]) -> str:
-        name_map = {
-            "KEY_LEFTMETA": "Super",
-            "KEY_RIGHTMETA": "Super",
-            "KEY_LEFTSHIFT": "Shift",
-            "KEY_RIGHTSHIFT": "Shift",
-            "KEY_LEFTCTRL": "Ctrl",
-            "KEY_RIGHTCTRL": "Ctrl",
-            "KEY_LEFTALT": "Alt",
-            "KEY_RIGHTALT": "Alt",
-        }
         readable = []
         for key in keys:
-            if key in name_map:
-                readable.append(name_map[key])
+            if key in _KEY_DISPLAY_NAMES:
+                readable.append(_KEY_DISPLAY_NAMES[key])
             elif key.startswith("KEY_"):
                 readable.append(key[4:])
             else:
@@ -337,4 +534,6 @@ def get_hotkey_help() -> str:
         f"  Rewrite selection: {format_keys(config['rewrite'])}",
         f"  Context reply: {format_keys(config['context_reply'])}",
     ]
-    return "\n".join(lines)
+    help_text = "\n".join(lines)
+    _hotkey_help_cache = (id(config), help_text)
+    return help_text
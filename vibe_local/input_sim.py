@@ -1,4 +1,6 @@
 """Cross-platform input simulation using pynput and pyperclip."""
+import atexit
+import os
 import platform
 import shutil
 import subprocess
@@ -12,6 +14,12 @@ from pynput.keyboard import Controller, Key
 # Keyboard controller for typing and key simulation
 _keyboard = Controller()
 
+# The platform never changes within a process, so resolve it (and the
+# platform shortcut modifier - Cmd on macOS, Ctrl elsewhere) once at import.
+_SYSTEM = platform.system()
+_IS_LINUX = _SYSTEM == "Linux"
+_SHORTCUT_MOD = Key.cmd if _SYSTEM == "Darwin" else Key.ctrl
+
 # Cache for tool availability
 _tool_cache: dict[str, bool] = {}
 
@@ -37,13 +45,13 @@ def check_dependencies() -> dict[str, bool]:
         results["pyperclip"] = False
 
     # On Linux, check for ydotool (preferred for Wayland)
-    if platform.system() == "Linux":
+    if _IS_LINUX:
         results["ydotool"] = _check_tool("ydotool")
 
     return results
 
 
-def type_text(text: str, interval: float = 0.01) -> bool:
+def type_text(text: str, interval: float | None = None) -> bool:
     """
     Type text at the current cursor position.
 
@@ -52,7 +60,8 @@ def type_text(text: str, interval: float = 0.01) -> bool:
 
     Args:
         text: Text to type
-        interval: Delay between keystrokes (seconds)
+        interval: Delay between keystrokes (seconds). Default None lets the
+            backend pace itself, which is much faster than explicit sleeps.
 
     Returns:
         True if successful
@@ -60,12 +69,12 @@ def type_text(text: str, interval: float = 0.01) -> bool:
     if not text:
         return True
 
-    system = platform.system()
-
     # On Linux, use ydotool for Wayland compatibility
-    if system == "Linux" and _check_tool("ydotool"):
+    if _IS_LINUX and _check_tool("ydotool"):
         try:
-            key_delay = int(interval * 1000)  # Convert to milliseconds
+            # ydotool's own typing loop is already rate-limited; an added
+            # per-key delay is mostly idle subprocess time.
+            key_delay = 0 if interval is None else int(interval * 1000)
             result = subprocess.run(
                 ["ydotool", "type", "--key-delay", str(key_delay), "--", text],
                 capture_output=True,
@@ -82,10 +91,15 @@ def type_text(text: str, interval: float = 0.01) -> bool:
 
     # Use pynput for Windows, macOS, or Linux fallback
     try:
-        for char in text:
-            _keyboard.type(char)
-            if interval > 0:
+        if interval is None or interval <= 0:
+            # One call lets pynput batch the whole string instead of paying
+            # a Python round-trip per character.
+            _keyboard.type(text)
+            return True
+        for i, char in enumerate(text):
+            if i:
                 time.sleep(interval)
+            _keyboard.type(char)
         return True
     except Exception as e:
         print(f"Error typing text: {e}")
@@ -111,14 +125,19 @@ def type_text_fast(text: str) -> bool:
         # Save current clipboard
         old_clipboard = get_clipboard()
 
-        # Set text to clipboard and paste
+        # Set text to clipboard, then poll until it actually holds our text
+        # instead of sleeping a fixed delay
         set_clipboard(text)
-        time.sleep(0.05)  # Small delay for clipboard to update
+        deadline = time.monotonic() + 0.1
+        while get_clipboard() != text and time.monotonic() < deadline:
+            time.sleep(0.005)
+
         paste_from_clipboard()
-        time.sleep(0.1)  # Wait for paste to complete
 
-        # Restore old clipboard
-        if old_clipboard:
+        # Restore old clipboard only if we changed it, after a short grace
+        # period so the target app has read the pasted text
+        if old_clipboard and old_clipboard != text:
+            time.sleep(0.02)
             set_clipboard(old_clipboard)
 
         return True
@@ -165,6 +184,81 @@ def set_clipboard(text: str) -> bool:
         return False
 
 
+# Persistent wl-paste watcher: forking wl-paste per get_selection costs a
+# few ms of fork+exec+loader work every time. The watcher runs `cat` on each
+# selection change and NUL-terminates each record so multi-line selections
+# stay intact.
+_selection_watcher: "subprocess.Popen | None" = None
+_selection_buf = b""
+_selection_latest: str | None = None
+
+
+def _stop_selection_watcher() -> None:
+    global _selection_watcher
+    if _selection_watcher is not None:
+        _selection_watcher.terminate()
+        _selection_watcher = None
+
+
+def _read_selection_watcher() -> str | None:
+    """Get the primary selection from the persistent watcher, if possible.
+
+    Returns None when the watcher is unavailable or has not yet observed a
+    selection change; callers should then fall back to a one-shot spawn.
+    """
+    global _selection_watcher, _selection_buf, _selection_latest
+
+    if _selection_watcher is None or _selection_watcher.poll() is not None:
+        if not _check_tool("wl-paste"):
+            return None
+        try:
+            _selection_watcher = subprocess.Popen(
+                ["wl-paste", "--primary", "--watch", "sh", "-c", 'cat; printf "\\0"'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            os.set_blocking(_selection_watcher.stdout.fileno(), False)
+            atexit.register(_stop_selection_watcher)
+        except Exception:
+            _selection_watcher = None
+            return None
+        # The watcher only reports changes made after it started
+        return None
+
+    try:
+        while True:
+            chunk = _selection_watcher.stdout.read()
+            if not chunk:
+                break
+            _selection_buf += chunk
+    except OSError:
+        pass
+
+    if b"\0" in _selection_buf:
+        records = _selection_buf.split(b"\0")
+        _selection_buf = records[-1]  # Incomplete trailing record, if any
+        _selection_latest = records[-2].decode("utf-8", errors="replace")
+
+    return _selection_latest
+
+
+def _run_selection_tool(argv: list[str], input_text: str | None = None) -> Optional[str]:
+    """Run a wl-clipboard/xclip command; returns stdout or None on failure."""
+    try:
+        result = subprocess.run(
+            argv,
+            input=input_text,
+            capture_output=True,
+            text=True,
+            timeout=2,
+        )
+        if result.returncode == 0:
+            return result.stdout
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    return None
+
+
 def get_selection() -> str:
     """
     Get the current text selection.
@@ -175,37 +269,20 @@ def get_selection() -> str:
     Returns:
         Selected text or empty string
     """
-    system = platform.system()
-
-    if system == "Linux":
-        # Try to get primary selection on Linux
-        try:
-            import subprocess
-            # Try wl-paste for Wayland
-            result = subprocess.run(
-                ["wl-paste", "--primary", "--no-newline"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                return result.stdout
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-        try:
-            # Try xclip for X11
-            import subprocess
-            result = subprocess.run(
-                ["xclip", "-selection", "primary", "-o"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                return result.stdout
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    if _IS_LINUX:
+        # Persistent watcher avoids a fork+exec per call
+        selection = _read_selection_watcher()
+        if selection is not None:
+            return selection
+
+        # wl-paste for Wayland, then xclip for X11
+        for argv in (
+            ["wl-paste", "--primary", "--no-newline"],
+            ["xclip", "-selection", "primary", "-o"],
+        ):
+            output = _run_selection_tool(argv)
+            if output is not None:
+                return output
 
     # Fallback: copy selection to clipboard and read it
     old_clipboard = get_clipboard()
@@ -230,42 +307,35 @@ def set_selection(text: str) -> bool:
     Returns:
         True if successful
     """
-    system = platform.system()
-
-    if system == "Linux":
-        # Try to set primary selection on Linux
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["wl-copy", "--primary"],
-                input=text,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
+    if _IS_LINUX:
+        # wl-copy for Wayland, then xclip for X11
+        for argv in (
+            ["wl-copy", "--primary"],
+            ["xclip", "-selection", "primary"],
+        ):
+            if _run_selection_tool(argv, input_text=text) is not None:
                 return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["xclip", "-selection", "primary"],
-                input=text,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
 
     # Fallback to clipboard
     return set_clipboard(text)
 
 
+def _shortcut_chord(char: str, description: str) -> bool:
+    """Press the platform shortcut modifier (Ctrl/Cmd) plus a character."""
+    try:
+        _keyboard.press(_SHORTCUT_MOD)
+        try:
+            _keyboard.press(char)
+            _keyboard.release(char)
+        finally:
+            # Never leave the modifier stuck down
+            _keyboard.release(_SHORTCUT_MOD)
+        return True
+    except Exception as e:
+        print(f"Error {description}: {e}")
+        return False
+
+
 def paste_from_clipboard() -> bool:
     """
     Simulate Ctrl+V (or Cmd+V on macOS) to paste from clipboard.
@@ -273,22 +343,7 @@ def paste_from_clipboard() -> bool:
     Returns:
         True if successful
     """
-    try:
-        system = platform.system()
-        if system == "Darwin":
-            # macOS uses Cmd+V
-            with _keyboard.pressed(Key.cmd):
-                _keyboard.press('v')
-                _keyboard.release('v')
-        else:
-            # Windows and Linux use Ctrl+V
-            with _keyboard.pressed(Key.ctrl):
-                _keyboard.press('v')
-                _keyboard.release('v')
-        return True
-    except Exception as e:
-        print(f"Error pasting: {e}")
-        return False
+    return _shortcut_chord('v', "pasting")
 
 
 def copy_selection() -> bool:
@@ -298,22 +353,7 @@ def copy_selection() -> bool:
     Returns:
         True if successful
     """
-    try:
-        system = platform.system()
-        if system == "Darwin":
-            # macOS uses Cmd+C
-            with _keyboard.pressed(Key.cmd):
-                _keyboard.press('c')
-                _keyboard.release('c')
-        else:
-            # Windows and Linux use Ctrl+C
-            with _keyboard.pressed(Key.ctrl):
-                _keyboard.press('c')
-                _keyboard.release('c')
-        return True
-    except Exception as e:
-        print(f"Error copying: {e}")
-        return False
+    return _shortcut_chord('c', "copying")
 
 
 def press_key(key: str) -> bool:
@@ -369,17 +409,4 @@ def select_all() -> bool:
     Returns:
         True if successful
     """
-    try:
-        system = platform.system()
-        if system == "Darwin":
-            with _keyboard.pressed(Key.cmd):
-                _keyboard.press('a')
-                _keyboard.release('a')
-        else:
-            with _keyboard.pressed(Key.ctrl):
-                _keyboard.press('a')
-                _keyboard.release('a')
-        return True
-    except Exception as e:
-        print(f"Error selecting all: {e}")
-        return False
+    return _shortcut_chord('a', "selecting all")
@@ -9,22 +9,59 @@ STYLE_PROMPTS = {
     "very_casual": "Use very casual language. Be relaxed and informal, like texting a friend.",
 }
 
+# Static prompt preambles. Keeping the leading bytes identical across calls
+# also lets Ollama reuse its KV-cache prefix for the same action type.
+_REWRITE_PREFIX = """Rewrite the following text according to the instruction.
+Only output the rewritten text, nothing else.
+
+Style: """
+
+_REPLY_PREFIX = """Based on the conversation context below, write a reply that expresses the given intent.
+Only output the reply text, nothing else. Do not include greetings unless appropriate for the context.
+
+Style: """
+
+
+# Cached client/model/style - constructing ollama.Client builds a fresh
+# httpx session (and connection pool) each time, so per-call construction
+# forced a new TCP connection to Ollama for every request.
+_client: ollama.Client | None = None
+_model_name: str | None = None
+_style_prompt: str | None = None
+
 
 def _get_client() -> ollama.Client:
-    """Get Ollama client."""
-    config = get_config().ollama
-    return ollama.Client(host=config["base_url"])
+    """Get Ollama client (cached)."""
+    global _client
+    if _client is None:
+        config = get_config().ollama
+        _client = ollama.Client(host=config["base_url"])
+    return _client
 
 
 def _get_model() -> str:
-    """Get configured model name."""
-    return get_config().ollama["model"]
+    """Get configured model name (cached)."""
+    global _model_name
+    if _model_name is None:
+        _model_name = get_config().ollama["model"]
+    return _model_name
 
 
 def _get_style_prompt() -> str:
-    """Get the style instruction based on config."""
-    style = get_config().style
-    return STYLE_PROMPTS.get(style, STYLE_PROMPTS["casual"])
+    """Get the style instruction based on config (cached)."""
+    global _style_prompt
+    if _style_prompt is None:
+        style = get_config().style
+        _style_prompt = STYLE_PROMPTS.get(style, STYLE_PROMPTS["casual"])
+    return _style_prompt
+
+
+def reset_llm_cache() -> None:
+    """Drop cached client/model/style, e.g. after a config change."""
+    global _client, _model_name, _style_prompt
+    _client = None
+    _model_name = None
+    _style_prompt = None
 
 
 def rewrite(text: str, instruction: str) -> str:
@@ -41,17 +78,12 @@ def rewrite(text: str, instruction: str) -> str:
     client = _get_client()
     style = _get_style_prompt()
 
-    prompt = f"""Rewrite the following text according to the instruction.
-Only output the rewritten text, nothing else.
-
-Style: {style}
-
-Instruction: {instruction}
-
-Text to rewrite:
-{text}
-
-Rewritten text:"""
+    prompt = "".join((
+        _REWRITE_PREFIX, style,
+        "\n\nInstruction: ", instruction,
+        "\n\nText to rewrite:\n", text,
+        "\n\nRewritten text:",
+    ))
 
     response = client.generate(
         model=_get_model(),
@@ -79,17 +111,12 @@ def context_reply(context: str, intent: str) -> str:
     client = _get_client()
     style = _get_style_prompt()
 
-    prompt = f"""Based on the conversation context below, write a reply that expresses the given intent.
-Only output the reply text, nothing else. Do not include greetings unless appropriate for the context.
-
-Style: {style}
-
-Conversation context:
-{context}
-
-Intent for reply: {intent}
-
-Reply:"""
+    prompt = "".join((
+        _REPLY_PREFIX, style,
+        "\n\nConversation context:\n", context,
+        "\n\nIntent for reply: ", intent,
+        "\n\nReply:",
+    ))
 
     response = client.generate(
         model=_get_model(),
@@ -129,6 +156,36 @@ def improve_transcription(text: str) -> str:
     return response["message"]["content"].strip()
 
 
+def improve_transcription_stream(text: str):
+    """
+    Clean up a transcription, streaming the result.
+
+    Yields chunks of the cleaned-up text as the model produces them, so the
+    caller can start typing while generation is still running.
+
+    Args:
+        text: Raw transcribed text
+    """
+    client = _get_client()
+
+    stream = client.chat(
+        model=_get_model(),
+        messages=[
+            {"role": "user", "content": f"Fix punctuation and capitalization in this text. Convert spoken symbols like 'forward slash' to '/'. Output ONLY the fixed text:\n\n{text}"},
+        ],
+        stream=True,
+        options={
+            "temperature": 0.1,
+            "num_predict": 256,
+        },
+    )
+
+    for chunk in stream:
+        piece = chunk["message"]["content"]
+        if piece:
+            yield piece
+
+
 def check_ollama_available() -> bool:
     """Check if Ollama is running and the model is available."""
     try:
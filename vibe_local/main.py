@@ -1,17 +1,24 @@
 """Main application - system tray and event coordination."""
-import asyncio
+import queue
 import signal
 import subprocess
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from .audio import PushToTalkRecorder
 from .config import get_config, init_config
 from .history import get_history
 from .hotkeys import HotkeyAction, HotkeyEvent, HotkeyListener, check_input_permissions, get_hotkey_help
-from .input_sim import check_dependencies, get_clipboard, get_selection, type_text
-from .llm import check_ollama_available, context_reply, ensure_model_available, improve_transcription, rewrite
-from .transcribe import transcribe
+from .input_sim import check_dependencies, get_clipboard, get_selection, type_text, type_text_fast
+from .llm import (
+    check_ollama_available,
+    context_reply,
+    ensure_model_available,
+    improve_transcription_stream,
+    rewrite,
+)
+from .transcribe import transcribe_stream
 from .tray_qt import VibeTray
 
 
@@ -22,10 +29,18 @@ class VibeLocal:
         self._recorder = PushToTalkRecorder()
         self._hotkey_listener = HotkeyListener()
         self._tray: VibeTray | None = None
-        self._loop: asyncio.AbstractEventLoop | None = None
         self._current_action: HotkeyAction | None = None
         self._running = False
 
+        # One persistent worker processes recordings in order - spawning a
+        # thread per hotkey release put thread startup on the critical path
+        # and threw away warm state between invocations.
+        self._jobs: queue.Queue = queue.Queue(maxsize=4)
+        threading.Thread(target=self._worker, daemon=True).start()
+
+        # For overlapping clipboard/selection IPC with transcription
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+
     def _notify(self, message: str, title: str = "Vibe Local") -> None:
         """Show a desktop notification."""
         if self._tray:
@@ -68,24 +83,44 @@ class VibeLocal:
             audio_data = self._recorder.release()
 
             if audio_data is not None and len(audio_data) > 0:
-                # Process in a thread to not block
-                threading.Thread(
-                    target=self._process_audio,
-                    args=(audio_data, self._current_action),
-                    daemon=True,
-                ).start()
+                # Hand off to the worker thread to not block
+                try:
+                    self._jobs.put_nowait((audio_data, self._current_action))
+                except queue.Full:
+                    self._notify("Busy - recording dropped")
 
             self._current_action = None
 
+    def _worker(self) -> None:
+        """Process queued recordings one at a time."""
+        while True:
+            audio_data, action = self._jobs.get()
+            self._process_audio(audio_data, action)
+
     def _process_audio(self, audio_data, action: HotkeyAction) -> None:
         """Process recorded audio based on the action."""
         try:
+            # Kick off the selection/clipboard grab now - the wl-paste/xclip
+            # subprocess round-trip overlaps transcription instead of
+            # running after it.
+            context_future = None
+            if action == HotkeyAction.REWRITE:
+                context_future = self._io_executor.submit(
+                    lambda: get_selection() or get_clipboard()
+                )
+            elif action == HotkeyAction.CONTEXT_REPLY:
+                context_future = self._io_executor.submit(get_clipboard)
+
             print(">>> Transcribing...")
             self._notify("Transcribing...")
 
-            # Transcribe the audio
-            text = transcribe(audio_data, self._recorder.sample_rate)
-            print(f">>> Raw: {text}")
+            # Transcribe the audio, surfacing each segment as it decodes
+            # instead of going quiet until the whole utterance is done
+            text_parts = []
+            for part in transcribe_stream(audio_data, self._recorder.sample_rate):
+                print(f">>> Raw: {part}")
+                text_parts.append(part)
+            text = " ".join(text_parts)
 
             if not text.strip():
                 print(">>> No speech detected")
@@ -93,24 +128,18 @@ class VibeLocal:
                 return
 
             if action == HotkeyAction.TRANSCRIBE:
-                # Clean up transcription with AI
+                # Clean up transcription with AI, typing as tokens stream in
                 print(">>> Cleaning up with AI...")
                 self._notify("Cleaning up...")
                 raw_text = text
-                text = improve_transcription(text)
+                text = self._type_streaming(improve_transcription_stream(text))
                 print(f">>> Clean: {text}")
-                print(">>> Typing...")
-                self._notify(f"Typing: {text[:50]}...")
-                type_text(text)
                 get_history().add(raw_text, text, "transcribe")
                 print(">>> Done!")
 
             elif action == HotkeyAction.REWRITE:
-                # Get selected text and rewrite it
-                selection = get_selection()
-                if not selection:
-                    # Try clipboard as fallback
-                    selection = get_clipboard()
+                # Get selected text (fetched during transcription) and rewrite it
+                selection = context_future.result()
 
                 if not selection:
                     self._notify("No text selected to rewrite")
@@ -119,12 +148,12 @@ class VibeLocal:
                 self._notify("Rewriting...")
                 rewritten = rewrite(selection, text)
                 self._notify(f"Typing: {rewritten[:50]}...")
-                type_text(rewritten)
+                self._type(rewritten)
                 get_history().add(text, rewritten, "rewrite")
 
             elif action == HotkeyAction.CONTEXT_REPLY:
-                # Get clipboard context and generate reply
-                context = get_clipboard()
+                # Get clipboard context (fetched during transcription)
+                context = context_future.result()
 
                 if not context:
                     self._notify("No context in clipboard")
@@ -133,36 +162,76 @@ class VibeLocal:
                 self._notify("Generating reply...")
                 reply = context_reply(context, text)
                 self._notify(f"Typing: {reply[:50]}...")
-                type_text(reply)
+                self._type(reply)
                 get_history().add(text, reply, "context_reply")
 
         except Exception as e:
             self._notify(f"Error: {str(e)[:50]}")
             print(f"Error processing audio: {e}")
 
+    def _type(self, text: str) -> None:
+        """Type text, pasting via the clipboard for long outputs.
+
+        Per-keystroke typing is the dominant latency for multi-paragraph
+        LLM outputs; one clipboard copy plus Ctrl+V is effectively O(1).
+        Users in paste-hostile apps can set typing.fast_paste: false.
+        """
+        typing_config = get_config().typing
+        if (
+            typing_config.get("fast_paste", True)
+            and len(text) > typing_config.get("fast_paste_threshold", 120)
+            and type_text_fast(text)
+        ):
+            return
+        type_text(text)
+
+    def _type_streaming(self, chunks) -> str:
+        """Type LLM output as it streams in; returns the full typed text.
+
+        A small bounded queue decouples reading Ollama's socket from the
+        (slower) typing, so generation is never blocked on keystrokes.
+        Whitespace at the end of the stream is held back so a trailing
+        newline never presses Enter in the target application.
+        """
+        chunk_queue: queue.Queue[str | None] = queue.Queue(maxsize=8)
+
+        def _pump() -> None:
+            try:
+                for chunk in chunks:
+                    chunk_queue.put(chunk)
+            except Exception as e:
+                print(f"Error streaming LLM output: {e}")
+            finally:
+                chunk_queue.put(None)
+
+        threading.Thread(target=_pump, daemon=True).start()
+
+        parts: list[str] = []
+        pending = ""
+        started = False
+        while True:
+            chunk = chunk_queue.get()
+            if chunk is None:
+                break
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            # Hold back trailing whitespace until more text arrives
+            chunk = pending + chunk
+            stripped = chunk.rstrip()
+            pending = chunk[len(stripped):]
+            if stripped:
+                parts.append(stripped)
+                type_text(stripped, interval=0)
+
+        return "".join(parts)
+
     def _on_quit(self) -> None:
         """Handle quit from tray."""
         self._running = False
         self._hotkey_listener.stop()
-        if self._loop:
-            self._loop.call_soon_threadsafe(self._loop.stop)
-
-    async def _run_hotkeys(self) -> None:
-        """Run the hotkey listener."""
-        self._hotkey_listener.add_callback(self._handle_hotkey)
-        await self._hotkey_listener.start()
-
-    def _run_hotkey_thread(self) -> None:
-        """Run hotkey listener in a separate thread."""
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-
-        try:
-            self._loop.run_until_complete(self._run_hotkeys())
-        except Exception as e:
-            print(f"Hotkey listener error: {e}")
-        finally:
-            self._loop.close()
 
     def run(self) -> None:
         """Run the application."""
@@ -207,9 +276,9 @@ class VibeLocal:
         # Create tray icon
         self._tray = VibeTray(on_quit=self._on_quit)
 
-        # Start hotkey listener in background thread
-        hotkey_thread = threading.Thread(target=self._run_hotkey_thread, daemon=True)
-        hotkey_thread.start()
+        # Start hotkey listener - it manages its own reader thread
+        self._hotkey_listener.add_callback(self._handle_hotkey)
+        self._hotkey_listener.start()
 
         # Run Qt tray in main thread (required by Qt)
         self._tray.run()
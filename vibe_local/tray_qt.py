@@ -1,267 +1,23 @@
-"""Qt-based system tray icon for KDE Wayland."""
-import subprocess
-import sys
-from PyQt6.QtWidgets import (
-    QApplication, QSystemTrayIcon, QMenu, QDialog, QVBoxLayout,
-    QHBoxLayout, QLabel, QLineEdit, QTextEdit, QPushButton, QTabWidget,
-    QWidget, QComboBox, QFormLayout, QListWidget, QListWidgetItem, QSplitter
-)
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QObject
-
-from .config import get_config
-from .history import get_history
-
-
-class SettingsDialog(QDialog):
-    """Settings dialog for Vibe Local."""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Vibe Local Settings")
-        self.setMinimumWidth(500)
-        self.setMinimumHeight(400)
-
-        self._config = get_config()
-        self._setup_ui()
-        self._load_settings()
-
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-
-        # Tab widget
-        tabs = QTabWidget()
-
-        # Vocabulary tab
-        vocab_tab = QWidget()
-        vocab_layout = QVBoxLayout(vocab_tab)
-        vocab_layout.addWidget(QLabel("Custom vocabulary (one term per line):"))
-        vocab_layout.addWidget(QLabel("These terms will be preserved exactly as written."))
-        self._vocab_edit = QTextEdit()
-        self._vocab_edit.setPlaceholderText("GameDevBuddy\nC++\nUnreal Engine\nuseState")
-        vocab_layout.addWidget(self._vocab_edit)
-        tabs.addTab(vocab_tab, "Vocabulary")
-
-        # Context tab
-        context_tab = QWidget()
-        context_layout = QFormLayout(context_tab)
-        self._context_edit = QLineEdit()
-        self._context_edit.setPlaceholderText("C++, Rust, React, Unreal Engine")
-        context_layout.addRow("Programming context:", self._context_edit)
-        context_layout.addRow("", QLabel("Helps the AI understand your domain"))
-
-        self._style_combo = QComboBox()
-        self._style_combo.addItems(["casual", "formal", "very_casual"])
-        context_layout.addRow("Writing style:", self._style_combo)
-
-        tabs.addTab(context_tab, "Context")
-
-        # Whisper tab
-        whisper_tab = QWidget()
-        whisper_layout = QFormLayout(whisper_tab)
-        self._model_combo = QComboBox()
-        self._model_combo.addItems(["tiny", "base", "small", "medium", "large-v3"])
-        whisper_layout.addRow("Whisper model:", self._model_combo)
-        whisper_layout.addRow("", QLabel("Larger = more accurate but slower"))
-
-        self._language_edit = QLineEdit()
-        self._language_edit.setPlaceholderText("en")
-        whisper_layout.addRow("Language:", self._language_edit)
-
-        tabs.addTab(whisper_tab, "Whisper")
-
-        layout.addWidget(tabs)
-
-        # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-
-        save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self._save_settings)
-        btn_layout.addWidget(save_btn)
-
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(cancel_btn)
-
-        layout.addLayout(btn_layout)
-
-    def _load_settings(self):
-        """Load current settings into the UI."""
-        # Vocabulary
-        vocab = self._config.vocabulary
-        self._vocab_edit.setPlainText("\n".join(vocab))
-
-        # Context
-        self._context_edit.setText(self._config.programming_context)
-
-        # Style
-        style = self._config.style
-        index = self._style_combo.findText(style)
-        if index >= 0:
-            self._style_combo.setCurrentIndex(index)
-
-        # Whisper
-        model = self._config.whisper.get("model", "medium")
-        index = self._model_combo.findText(model)
-        if index >= 0:
-            self._model_combo.setCurrentIndex(index)
-
-        self._language_edit.setText(self._config.whisper.get("language", "en"))
-
-    def _save_settings(self):
-        """Save settings to config file."""
-        # Vocabulary
-        vocab_text = self._vocab_edit.toPlainText()
-        vocab_list = [v.strip() for v in vocab_text.split("\n") if v.strip()]
-        self._config._config["vocabulary"] = vocab_list
-
-        # Context
-        self._config._config["programming_context"] = self._context_edit.text()
-
-        # Style
-        self._config._config["style"] = self._style_combo.currentText()
-
-        # Whisper
-        self._config._config["whisper"]["model"] = self._model_combo.currentText()
-        self._config._config["whisper"]["language"] = self._language_edit.text()
-
-        # Save to file
-        self._config.save()
+"""Qt-based system tray icon for KDE Wayland.
 
-        self.accept()
-
-
-class HistoryDialog(QDialog):
-    """Dialog showing transcription history."""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Transcription History")
-        self.setMinimumWidth(600)
-        self.setMinimumHeight(400)
-
-        self._history = get_history()
-        self._setup_ui()
-        self._load_history()
-
-        # Listen for history changes
-        self._history.add_change_callback(self._load_history)
-
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-
-        # Splitter for list and detail
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-
-        # Left side: list of entries
-        self._list = QListWidget()
-        self._list.currentRowChanged.connect(self._on_selection_changed)
-        splitter.addWidget(self._list)
-
-        # Right side: detail view
-        detail_widget = QWidget()
-        detail_layout = QVBoxLayout(detail_widget)
-
-        detail_layout.addWidget(QLabel("Final text:"))
-        self._final_text = QTextEdit()
-        self._final_text.setReadOnly(True)
-        detail_layout.addWidget(self._final_text)
-
-        detail_layout.addWidget(QLabel("Raw transcription:"))
-        self._raw_text = QTextEdit()
-        self._raw_text.setReadOnly(True)
-        self._raw_text.setMaximumHeight(80)
-        detail_layout.addWidget(self._raw_text)
-
-        splitter.addWidget(detail_widget)
-        splitter.setSizes([200, 400])
-
-        layout.addWidget(splitter)
-
-        # Buttons
-        btn_layout = QHBoxLayout()
-
-        copy_btn = QPushButton("Copy to Clipboard")
-        copy_btn.clicked.connect(self._copy_to_clipboard)
-        btn_layout.addWidget(copy_btn)
-
-        btn_layout.addStretch()
-
-        clear_btn = QPushButton("Clear History")
-        clear_btn.clicked.connect(self._clear_history)
-        btn_layout.addWidget(clear_btn)
-
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        btn_layout.addWidget(close_btn)
-
-        layout.addLayout(btn_layout)
-
-    def _load_history(self):
-        """Load history entries into the list."""
-        self._list.clear()
-        entries = self._history.get_entries()
-
-        for entry in entries:
-            # Format: time - preview of text
-            time_str = entry.timestamp.strftime("%H:%M:%S")
-            preview = entry.final_text[:40].replace("\n", " ")
-            if len(entry.final_text) > 40:
-                preview += "..."
-
-            action_icons = {
-                "transcribe": "",
-                "rewrite": "[R] ",
-                "context_reply": "[C] ",
-            }
-            icon = action_icons.get(entry.action, "")
-
-            item = QListWidgetItem(f"{time_str} - {icon}{preview}")
-            item.setData(Qt.ItemDataRole.UserRole, entry)
-            self._list.addItem(item)
-
-        # Select first item if available
-        if self._list.count() > 0:
-            self._list.setCurrentRow(0)
-
-    def _on_selection_changed(self, row: int):
-        """Handle selection change in the list."""
-        if row < 0:
-            self._final_text.clear()
-            self._raw_text.clear()
-            return
-
-        item = self._list.item(row)
-        entry = item.data(Qt.ItemDataRole.UserRole)
-
-        self._final_text.setPlainText(entry.final_text)
-        self._raw_text.setPlainText(entry.raw_text)
+The settings and history dialogs live in vibe_local.dialogs and are only
+imported when first opened - the tray itself starts without paying for the
+dialog widget classes.
+"""
+import sys
+import threading
+from pathlib import Path
 
-    def _copy_to_clipboard(self):
-        """Copy the final text to clipboard."""
-        text = self._final_text.toPlainText()
-        if text:
-            try:
-                subprocess.run(
-                    ["wl-copy", text],
-                    check=True,
-                    timeout=2,
-                )
-            except Exception:
-                # Fallback to Qt clipboard
-                app = QApplication.instance()
-                if app:
-                    app.clipboard().setText(text)
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
+from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache, QPainter, QColor, QBrush
+from PyQt6.QtCore import Qt, pyqtSignal, QObject
 
-    def _clear_history(self):
-        """Clear all history."""
-        self._history.clear()
+from .config import get_config
+from .transcribe import warm_up
 
-    def closeEvent(self, event):
-        """Clean up when dialog closes."""
-        self._history.remove_change_callback(self._load_history)
-        super().closeEvent(event)
+# Shipped tray icons. SVG lets Qt render crisply at whatever size the tray
+# asks for, instead of resampling one 64x64 bitmap.
+_ICON_DIR = Path(__file__).parent / "icons"
 
 
 class TraySignals(QObject):
@@ -280,21 +36,48 @@ class VibeTray:
         self._signals = TraySignals()
         self._signals.set_recording.connect(self._on_set_recording)
         self._signals.show_message.connect(self._on_show_message)
+        # Both state icons, rendered once in run() - repainting a 64x64
+        # pixmap on every recording toggle kept QPainter on the UI hot path
+        self._icons: dict[bool, QIcon] = {}
+        # Dialogs are built once and re-shown - reconstruction re-laid-out
+        # the whole widget tree on every menu click
+        self._settings_dialog = None
+        self._history_dialog = None
 
     def _create_icon(self, recording=False) -> QIcon:
-        """Create the tray icon."""
-        size = 64
+        """Load the tray icon, painting it as a fallback."""
+        svg = _ICON_DIR / ("recording.svg" if recording else "idle.svg")
+        if svg.exists():
+            return QIcon(str(svg))
+
+        # Painted fallback: rasterize each common tray size once so Qt
+        # picks an exact match instead of resampling a lone 64x64 bitmap,
+        # and share the pixmaps process-wide through QPixmapCache
+        icon = QIcon()
+        for size in (16, 22, 32, 48, 64):
+            key = f"vibe:{recording}:{size}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None or pixmap.isNull():
+                pixmap = self._paint_pixmap(recording, size)
+                QPixmapCache.insert(key, pixmap)
+            icon.addPixmap(pixmap)
+        return icon
+
+    def _paint_pixmap(self, recording: bool, size: int) -> QPixmap:
+        """Paint one icon pixmap at the given size."""
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Shapes are laid out in 64-unit coordinates
+        painter.scale(size / 64, size / 64)
 
         if recording:
             # Red circle when recording
             painter.setBrush(QBrush(QColor("#F44336")))
             painter.setPen(QColor("#B71C1C"))
-            painter.drawEllipse(4, 4, size-8, size-8)
+            painter.drawEllipse(4, 4, 56, 56)
         else:
             # Green microphone when idle
             painter.setBrush(QBrush(QColor("#4CAF50")))
@@ -307,12 +90,12 @@ class VibeTray:
             painter.drawRect(22, 52, 20, 4)
 
         painter.end()
-        return QIcon(pixmap)
+        return pixmap
 
     def _on_set_recording(self, recording: bool):
         """Update icon based on recording state."""
         if self._tray:
-            self._tray.setIcon(self._create_icon(recording))
+            self._tray.setIcon(self._icons[recording])
 
     def _on_show_message(self, title: str, message: str):
         """Show a notification."""
@@ -329,13 +112,21 @@ class VibeTray:
 
     def _open_settings(self):
         """Open settings dialog."""
-        dialog = SettingsDialog()
-        dialog.exec()
+        if self._settings_dialog is None:
+            from .dialogs.settings import SettingsDialog
+            self._settings_dialog = SettingsDialog()
+        self._settings_dialog.show()
+        self._settings_dialog.raise_()
+        self._settings_dialog.activateWindow()
 
     def _open_history(self):
         """Open history dialog."""
-        dialog = HistoryDialog()
-        dialog.exec()
+        if self._history_dialog is None:
+            from .dialogs.history import HistoryDialog
+            self._history_dialog = HistoryDialog()
+        self._history_dialog.show()
+        self._history_dialog.raise_()
+        self._history_dialog.activateWindow()
 
     def _quit(self):
         """Handle quit action."""
@@ -349,8 +140,10 @@ class VibeTray:
         self._app = QApplication(sys.argv)
         self._app.setQuitOnLastWindowClosed(False)
 
+        self._icons = {False: self._create_icon(False), True: self._create_icon(True)}
+
         self._tray = QSystemTrayIcon()
-        self._tray.setIcon(self._create_icon(False))
+        self._tray.setIcon(self._icons[False])
         self._tray.setToolTip("Vibe Local - Ctrl+Shift to record")
 
         # Create menu
@@ -370,6 +163,12 @@ class VibeTray:
         self._tray.setContextMenu(menu)
         self._tray.show()
 
+        # Load Whisper while the user is not yet talking - the first hotkey
+        # press then starts at steady-state latency instead of paying the
+        # multi-second cold start
+        if get_config().whisper.get("warmup", True):
+            threading.Thread(target=warm_up, daemon=True).start()
+
         return self._app.exec()
 
 